@@ -254,8 +254,11 @@ class Bar(object):
             end_key = start_key + duration_ms
 
             if notes:
+                # Look up the shared start and end lists once per chord, not once per note
+                start_events = score.setdefault(start_key, [])
+                end_events = None
                 for note in notes:
-                    score.setdefault(start_key, []).append(
+                    start_events.append(
                         {
                             'func': 'start_note',
                             'note': note,
@@ -274,15 +277,15 @@ class Bar(object):
                             }
                         )
                     elif not isinstance(note, PercussionNote):
-                        score.setdefault(end_key, []).append(
+                        if end_events is None:
+                            end_events = score.setdefault(end_key, [])
+                        end_events.append(
                             {
                                 'func': 'end_note',
                                 'note': note,
                                 'channel': channel,
                             }
                         )
-                else:
-                    pass
         return get_bar_length(self.meter, bpm)
 
     def __add__(self, note_container):
@@ -19,12 +19,12 @@ from __future__ import absolute_import
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
+from functools import lru_cache
 
 from mingus.core import notes, intervals
 import mingus.containers.midi_percussion as mp
 from mingus.containers.mt_exceptions import NoteFormatError
-from math import log
-import six
+from math import log2
 
 _DEFAULT_NAME = "C"
 _DEFAULT_OCTAVE = 4
@@ -32,6 +32,64 @@ _DEFAULT_CHANNEL = 1
 _DEFAULT_VELOCITY = 64
 
 
+def _build_name_table():
+    """Map every note name with up to three sharps or flats to its value
+    relative to the C of the same octave (so 'Cb' is -1 and 'B#' is 12)."""
+    table = {}
+    for base in "CDEFGAB":
+        value = notes.note_to_int(base)
+        table[base] = value
+        for n in range(1, 4):
+            table[base + "#" * n] = value + n
+            table[base + "b" * n] = value - n
+    return table
+
+
+_NAME_PC = _build_name_table()
+
+# Frequencies of the first 128 note values for A-4 == 440 Hz.
+# int(Note("A")) == 57
+_HZ_440 = tuple(2 ** ((i - 57) / 12.0) * 440 for i in range(128))
+
+# Helmholtz pitch notation: letters set the name and octave, commas and
+# apostrophes move the octave.
+_SHORTHAND_NOTES = {x: (x.upper(), 3) for x in "abcdefg"}
+_SHORTHAND_NOTES.update({x: (x, 2) for x in "ABCDEFG"})
+_SHORTHAND_OCTAVES = {",": -1, "'": 1}
+
+
+def _name_value(name):
+    """Return the value of a note name relative to the C of its octave."""
+    try:
+        return _NAME_PC[name]
+    except KeyError:
+        res = notes.note_to_int(name[0])
+        for n in name[1:]:
+            if n == "#":
+                res += 1
+            elif n == "b":
+                res -= 1
+        return res
+
+
+@lru_cache(maxsize=1024)
+def _transposed_name(name, interval, up):
+    """Return the name on interval up or down from name, together with the
+    octave shift (-1, 0 or 1) needed to get there.
+
+    intervals.from_shorthand looks the note up in the C major scale and then
+    augments or diminishes it until the interval is right, which is most of
+    the cost of Note.transpose.
+    """
+    new_name = intervals.from_shorthand(name, interval, up)
+    # The octave wraps when the new name lies on the other side of the old
+    # one within the same octave.
+    delta = _name_value(new_name) - _name_value(name)
+    if up:
+        return new_name, 1 if delta < 0 else 0
+    return new_name, -1 if delta > 0 else 0
+
+
 class Note(object):
 
     """A note object.
@@ -48,6 +106,9 @@ class Note(object):
     You can use the class NoteContainer to group Notes together in intervals
     and chords.
     """
+    # 'string' and 'fret' are optional annotations read by mingus.extra.tablature
+    __slots__ = ("_name", "_octave", "velocity", "channel", "_int", "_repr", "string", "fret")
+
     def __init__(self, name="C", octave=4, dynamics=None, velocity=64, channel=None):
         """
         :param name:
@@ -58,18 +119,20 @@ class Note(object):
         """
         # Save params for json encode and decode
         self.channel = channel
-
-        if dynamics is None:
-            dynamics = {}
-
-        dynamics["velocity"] = velocity
         self.velocity = velocity
 
-        if channel is not None:
-            dynamics["channel"] = channel
+        if dynamics is not None:
+            dynamics["velocity"] = velocity
+            if channel is not None:
+                dynamics["channel"] = channel
 
-        if isinstance(name, six.string_types):
-            self.set_note(name, octave, dynamics)
+        if isinstance(name, str):
+            if dynamics is None:
+                # Validate here, set_note takes velocity=None to mean "not given"
+                self.set_velocity(velocity)
+                self.set_note(name, octave, channel=channel)
+            else:
+                self.set_note(name, octave, dynamics)
         elif hasattr(name, "name"):
             # Hard copy Note object
             # noinspection PyUnresolvedReferences
@@ -89,6 +152,26 @@ class Note(object):
             "velocity": self.velocity,
         }
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._int = None
+        self._repr = None
+
+    @property
+    def octave(self):
+        return self._octave
+
+    @octave.setter
+    def octave(self, octave):
+        self._octave = octave
+        self._int = None
+        self._repr = None
+
     def set_channel(self, channel):
         if not 0 <= channel < 16:
             raise ValueError("MIDI channel must be 0-15")
@@ -112,35 +195,28 @@ class Note(object):
         :param int channel: Integer (0-15)
         :return:
         """
-        if dynamics is None:
-            dynamics = {}
-
         if velocity is not None:
             self.set_velocity(velocity)
-        elif "velocity" in dynamics:
+        elif dynamics and "velocity" in dynamics:
             self.set_velocity(dynamics["velocity"])
 
         if channel is not None:
             self.set_channel(channel)
-        if "channel" in dynamics:
+        if dynamics and "channel" in dynamics:
             self.set_channel(dynamics["channel"])
 
-        dash_index = name.split("-")
-        if len(dash_index) == 1:
-            if notes.is_valid_note(name):
-                self.name = name
-                self.octave = octave
-                return self
-            else:
-                raise NoteFormatError("Invalid note representation: %r" % name)
-        elif len(dash_index) == 2:
-            note, octave = dash_index
-            if notes.is_valid_note(note):
-                self.name = note
-                self.octave = int(octave)
-                return self
-            else:
+        dash_index = name.find("-")
+        if dash_index < 0:
+            note = name
+        else:
+            note = name[:dash_index]
+            octave = name[dash_index + 1:]
+            if "-" in octave:
                 raise NoteFormatError("Invalid note representation: %r" % name)
+        if note in _NAME_PC or notes.is_valid_note(note):
+            self.name = note
+            self.octave = octave if dash_index < 0 else int(octave)
+            return self
         else:
             raise NoteFormatError("Invalid note representation: %r" % name)
 
@@ -191,14 +267,9 @@ class Note(object):
         >>> a
         'A-4'
         """
-        (old, o_octave) = (self.name, self.octave)
-        self.name = intervals.from_shorthand(self.name, interval, up)
-        if up:
-            if self < Note(old, o_octave):
-                self.octave += 1
-        else:
-            if self > Note(old, o_octave):
-                self.octave -= 1
+        self.name, shift = _transposed_name(self._name, interval, up)
+        if shift:
+            self.octave += shift
 
     def from_int(self, integer):
         """Set the Note corresponding to the integer.
@@ -222,7 +293,7 @@ class Note(object):
         >>> Note('D').measure(Note('C'))
         -2
         """
-        return int(other) - int(self)
+        return int(other) - self.__int__()
 
     def to_hertz(self, standard_pitch=440):
         """Return the Note in Hz.
@@ -230,8 +301,13 @@ class Note(object):
         The standard_pitch argument can be used to set the pitch of A-4,
         from which the rest is calculated.
         """
+        value = self.__int__()
+        if 0 <= value < 128:
+            if standard_pitch == 440:
+                return _HZ_440[value]
+            return _HZ_440[value] * (standard_pitch / 440.0)
         # int(Note("A")) == 57
-        diff = self.__int__() - 57
+        diff = value - 57
         return 2 ** (diff / 12.0) * standard_pitch
 
     def from_hertz(self, hertz, standard_pitch=440):
@@ -241,7 +317,7 @@ class Note(object):
         from which the rest is calculated.
         """
         value = (
-            log((float(hertz) * 1024) / standard_pitch, 2) + 1.0 / 24
+            log2((float(hertz) * 1024) / standard_pitch) + 1.0 / 24
         ) * 12 + 9  # notes.note_to_int("A")
         self.name = notes.int_to_note(int(value) % 12)
         self.octave = int(value / 12) - 6
@@ -260,18 +336,12 @@ class Note(object):
         >>> Note('C-1').to_shorthand()
         'C,'
         """
-        if self.octave < 3:
-            res = self.name
-        else:
-            res = str.lower(self.name)
-        o = self.octave - 3
-        while o < -1:
-            res += ","
-            o += 1
-        while o > 0:
-            res += "'"
-            o -= 1
-        return res
+        o = self._octave - 3
+        if o < -1:
+            return self._name + "," * (-o - 1)
+        if o < 0:
+            return self._name
+        return self._name.lower() + "'" * o
 
     def from_shorthand(self, shorthand):
         """Convert from traditional Helmhotz pitch notation.
@@ -287,19 +357,15 @@ class Note(object):
         name = ""
         octave = 0
         for x in shorthand:
-            if x in ["a", "b", "c", "d", "e", "f", "g"]:
-                name = str.upper(x)
-                octave = 3
-            elif x in ["A", "B", "C", "D", "E", "F", "G"]:
-                name = x
-                octave = 2
-            elif x in ["#", "b"]:
+            note = _SHORTHAND_NOTES.get(x)
+            if note is not None:
+                name, octave = note
+            elif x == "#":
+                # A 'b' always reads as the note name, never as a flat
                 name += x
-            elif x == ",":
-                octave -= 1
-            elif x == "'":
-                octave += 1
-        return self.set_note(name, octave, {})
+            else:
+                octave += _SHORTHAND_OCTAVES.get(x, 0)
+        return self.set_note(name, octave)
 
     def __int__(self):
         """Return the current octave multiplied by twelve and add
@@ -307,14 +373,16 @@ class Note(object):
 
         This means a C-0 returns 0, C-1 returns 12, etc. This method allows
         you to use int() on Notes.
+
+        The result is cached until the name or octave changes.
         """
-        res = self.octave * 12 + notes.note_to_int(self.name[0])
-        for n in self.name[1:]:
-            if n == "#":
-                res += 1
-            elif n == "b":
-                res -= 1
-        return res
+        if self._int is None:
+            try:
+                res = _NAME_PC[self._name]
+            except KeyError:
+                res = _name_value(self._name)
+            self._int = self._octave * 12 + res
+        return self._int
 
     def __lt__(self, other):
         """Enable the comparing operators on Notes (>, <, ==, !=, >= and <=).
@@ -329,29 +397,50 @@ class Note(object):
         """
         if other is None:
             return False
-        return int(self) < int(other)
+        return self.__int__() < (other.__int__() if isinstance(other, Note) else int(other))
 
     def __eq__(self, other):
         """Compare Notes for equality by comparing their note values."""
+        if self is other:
+            return True
         if other is None:
             return False
-        return int(self) == int(other)
+        if type(other) is Note and self._name == other._name and self._octave == other._octave:
+            return True
+        return self.__int__() == (other.__int__() if isinstance(other, Note) else int(other))
+
+    def __hash__(self):
+        """Hash on the note value, consistent with __eq__.
+
+        Don't change a Note while it is used in a set or as a dict key.
+        """
+        return self.__int__()
 
     def __ne__(self, other):
-        return not self == other
+        if other is None:
+            return True
+        return self.__int__() != (other.__int__() if isinstance(other, Note) else int(other))
 
     def __gt__(self, other):
-        return not (self < other or self == other)
+        if other is None:
+            return True
+        return self.__int__() > (other.__int__() if isinstance(other, Note) else int(other))
 
     def __le__(self, other):
-        return self < other or self == other
+        if other is None:
+            return False
+        return self.__int__() <= (other.__int__() if isinstance(other, Note) else int(other))
 
     def __ge__(self, other):
-        return not self < other
+        if other is None:
+            return True
+        return self.__int__() >= (other.__int__() if isinstance(other, Note) else int(other))
 
     def __repr__(self):
         """Return a helpful representation for printing Note classes."""
-        return "'%s-%d'" % (self.name, self.octave)
+        if self._repr is None:
+            self._repr = "'%s-%d'" % (self._name, self._octave)
+        return self._repr
 
     def to_json(self):
         d = {
@@ -366,6 +455,7 @@ class Note(object):
 
 class PercussionNote(Note):
     """Percusion notes do not have a name of the staff (e.g. C or F#)"""
+    __slots__ = ("key_number", "duration")
 
     # noinspection PyMissingConstructor
     def __init__(self, name, number=None, velocity=64, channel=None, duration=None):
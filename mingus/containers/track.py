@@ -39,13 +39,18 @@ class MidiControl(Enum):
     CHORUS = 93
 
 
+_MIDI_CONTROLS = {control.value: control for control in MidiControl}
+
+
 class ControlChangeEvent(mingus_json.JsonMixin):
+    __slots__ = ("beat", "control", "value")
+
     def __init__(self, beat: float, control: Union[MidiControl, int], value: int):
         self.beat = beat
         if isinstance(control, int):
-            self.control = MidiControl(control)
-        else:
-            self.control = control
+            # MidiControl() still raises the ValueError for unknown numbers
+            control = _MIDI_CONTROLS.get(control) or MidiControl(control)
+        self.control = control
         self.value = value
 
     def put_into_score(self, score, channel, bpm):
@@ -58,6 +63,21 @@ class ControlChangeEvent(mingus_json.JsonMixin):
                 'value': self.value
             })
     
+    @staticmethod
+    def schedule_many(beats, bpm):
+        """
+        Return the score times in milliseconds for a whole array of beats, rounded the same way as
+        put_into_score. Useful for dense controller curves. Requires numpy.
+
+        :param beats: sequence or numpy array of beats
+        :param bpm: beats per minute
+        :return: numpy int64 array of times in milliseconds
+        """
+        import numpy
+
+        beats = numpy.asarray(beats, dtype=numpy.float64)
+        return numpy.round((beats / bpm) * 60000.0).astype(numpy.int64)
+
     def to_json(self):
         event_dict = super().to_json()
         event_dict["beat"] = self.beat
@@ -67,6 +87,7 @@ class ControlChangeEvent(mingus_json.JsonMixin):
 
 
 class Track(mingus_json.JsonMixin):
+    __slots__ = ("bars", "snippets", "events", "bpm", "instrument", "name", "tuning")
 
     def __init__(self, instrument: Union["MidiInstrument", "MidiPercussion"], bpm=120.0, name=None,
                  bars: Optional[list] = None, snippets: Optional[list] = None):
@@ -79,8 +100,10 @@ class Track(mingus_json.JsonMixin):
 
     def add_bar(self, bar, n_times=1):
         """Add a Bar to the current track."""
-        for _ in range(n_times):
+        if n_times == 1:
             self.bars.append(bar)
+        else:
+            self.bars.extend([bar] * n_times)
         return self
 
     def add_snippet(self, snippet):
@@ -135,8 +158,7 @@ class Track(mingus_json.JsonMixin):
         """Return an iterator that iterates through every bar in the this
         track."""
         for bar in self.bars:
-            for beat, duration, notes in bar:
-                yield beat, duration, notes
+            yield from map(tuple, bar.bar)
 
     def from_chords(self, chords, duration=1):
         """Add chords to the Track.
@@ -247,6 +269,10 @@ class Track(mingus_json.JsonMixin):
         """Enable the '[]' notation for Tracks."""
         return self.bars[index]
 
+    def __iter__(self):
+        """Iterate over the Bars in the Track."""
+        return iter(self.bars)
+
     def __setitem__(self, index, value):
         """Enable the '[] =' notation for Tracks.
 
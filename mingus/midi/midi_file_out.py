@@ -22,7 +22,6 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 from mingus.midi.midi_track import MidiTrack
-from binascii import a2b_hex
 from six.moves import range
 
 
@@ -46,12 +45,13 @@ class MidiFile(object):
 
     def header(self):
         """Return a header for type 1 MIDI file."""
-        tracks = a2b_hex("%04x" % len([t for t in self.tracks if t.track_data != ""]))
+        tracks = len([t for t in self.tracks if t.track_data != b""]).to_bytes(2, "big")
         return b"MThd\x00\x00\x00\x06\x00\x01" + tracks + self.time_division
 
     def reset(self):
         """Reset every track."""
-        [t.reset() for t in self.tracks]
+        for t in self.tracks:
+            t.reset()
 
     def write_file(self, file, verbose=False):
         """Collect the data from get_midi_data and write to file."""
@@ -24,8 +24,7 @@ http://www.sonicspot.com/guide/midifiles.html
 """
 from __future__ import absolute_import, division
 
-from binascii import a2b_hex
-from math import log
+from functools import lru_cache
 from struct import pack
 
 from six.moves import range
@@ -33,6 +32,49 @@ from six.moves import range
 from mingus.core.keys import Key, major_keys, minor_keys
 from mingus.midi.midi_events import *
 
+_SINGLE_VARBYTES = tuple(bytes((i,)) for i in range(0x80))
+_NOTE_OFF_STATUS = NOTE_OFF << 4
+_NOTE_ON_STATUS = NOTE_ON << 4
+
+
+def _key_signature_bodies():
+    """Return the key signature events, without delta time, for every major
+    and minor key."""
+    bodies = {}
+    for i, (major, minor) in enumerate(zip(major_keys, minor_keys)):
+        # Number of sharps, or flats when negative, stored as a signed byte
+        val = bytes(((i - 7) & 0xFF,))
+        bodies[major] = b"".join((META_EVENT, KEY_SIGNATURE, b"\x02", val, b"\x00"))
+        bodies[minor] = b"".join((META_EVENT, KEY_SIGNATURE, b"\x02", val, b"\x01"))
+    return bodies
+
+
+_KEY_SIGNATURES = _key_signature_bodies()
+
+
+@lru_cache(maxsize=256)
+def _tempo_event(bpm):
+    """Return the bytes of a set tempo meta event, without delta time.
+
+    Every MidiTrack starts with a tempo event, nearly always at the default
+    120 bpm.
+    """
+    # Microseconds per quarter note
+    mpqn = int(60000000 // bpm).to_bytes(3, "big")
+    return b"".join((META_EVENT, SET_TEMPO, b"\x03", mpqn))
+
+
+@lru_cache(maxsize=256)
+def _time_signature_event(numerator, denominator):
+    """Return the bytes of a time signature meta event, without delta time.
+
+    play_Bar writes one for every bar, almost always for the same meter.
+    """
+    numer = bytes((numerator,))
+    # The denominator is stored as a power of two
+    denom = bytes((denominator.bit_length() - 1,))
+    return b"".join((META_EVENT, TIME_SIGNATURE, b"\x04", numer, denom, b"\x18\x08"))
+
 
 class MidiTrack(object):
 
@@ -45,9 +87,14 @@ class MidiTrack(object):
     bpm = 120
     change_instrument = False
     instrument = 1
+    _stream = None
+    _streamed = False
+    _stream_header_pos = 0
+    _stream_length = 0
 
     def __init__(self, start_bpm=120):
-        self.track_data = b""
+        # A bytearray, so that adding events with += extends it in place
+        self.track_data = bytearray()
         self.set_tempo(start_bpm)
 
     def end_of_track(self):
@@ -78,11 +125,17 @@ class MidiTrack(object):
         Note.channel and Note.velocity can be set as well.
         """
         if len(notecontainer) <= 1:
-            [self.play_Note(x) for x in notecontainer]
+            for x in notecontainer:
+                self.play_Note(x)
         else:
             self.play_Note(notecontainer[0])
             self.set_deltatime(0)
-            [self.play_Note(x) for x in notecontainer[1:]]
+            # Any instrument change went out with the first note, so the rest
+            # of the chord only needs its note_on events
+            note_on = self.note_on
+            track_data = self.track_data
+            for x in notecontainer[1:]:
+                track_data += note_on(x.channel, int(x) + 12, x.velocity)
 
     def play_Bar(self, bar):
         """Convert a Bar object to MIDI events and write them to the
@@ -105,6 +158,7 @@ class MidiTrack(object):
                 self.play_NoteContainer(x[2])
                 self.set_deltatime(self.int_to_varbyte(tick))
                 self.stop_NoteContainer(x[2])
+        self.flush_stream()
 
     def play_Track(self, track):
         """Convert a Track object to MIDI events and write them to the
@@ -131,11 +185,15 @@ class MidiTrack(object):
         # if there is more than one note in the container, the deltatime should
         # be set back to zero after the first one has been stopped
         if len(notecontainer) <= 1:
-            [self.stop_Note(x) for x in notecontainer]
+            for x in notecontainer:
+                self.stop_Note(x)
         else:
             self.stop_Note(notecontainer[0])
             self.set_deltatime(0)
-            [self.stop_Note(x) for x in notecontainer[1:]]
+            note_off = self.note_off
+            track_data = self.track_data
+            for x in notecontainer[1:]:
+                track_data += note_off(x.channel, int(x) + 12, x.velocity)
 
     def set_instrument(self, channel, instr, bank=1):
         """Add a program change and bank select event to the track_data."""
@@ -147,9 +205,12 @@ class MidiTrack(object):
 
         The header contains the length of the track_data, so you'll have to
         call this function when you're done adding data (when you're not
-        using get_midi_data).
+        using get_midi_data). Raise a ValueError for a track written with
+        stream_to, because track_data then only holds the latest events.
         """
-        chunk_size = a2b_hex("%08x" % (len(self.track_data) + len(self.end_of_track())))
+        if self._streamed:
+            raise ValueError("The track was written with stream_to, its data is in the stream")
+        chunk_size = (len(self.track_data) + len(self.end_of_track())).to_bytes(4, "big")
         return TRACK_HEADER + chunk_size
 
     def get_midi_data(self):
@@ -157,7 +218,56 @@ class MidiTrack(object):
 
         Include header, track_data and the end of track meta event.
         """
-        return self.header() + self.track_data + self.end_of_track()
+        return b"".join((self.header(), self.track_data, self.end_of_track()))
+
+    def stream_to(self, fp):
+        """Write the track to the binary file object fp while it is being
+        built, instead of keeping all of it in track_data.
+
+        The track header is written right away with a placeholder length,
+        followed by whatever is already in track_data. After that the
+        events are written to fp at the end of every bar. Call end_stream
+        when you're done adding data. fp has to be seekable.
+
+        A streamed track can only be finished through end_stream: header and
+        get_midi_data raise a ValueError, during and after streaming. Don't
+        add the track to a MidiFile either, its data would be missing there.
+        """
+        self._stream = fp
+        self._streamed = True
+        self._stream_header_pos = fp.tell()
+        fp.write(TRACK_HEADER + b"\x00\x00\x00\x00")
+        self._stream_length = 0
+        self.flush_stream()
+
+    def flush_stream(self):
+        """Write track_data to the stream started with stream_to, and empty
+        it. Does nothing when the track is not being streamed."""
+        if self._stream is None:
+            return
+        self._stream.write(self.track_data)
+        self._stream_length += len(self.track_data)
+        self.track_data = bytearray()
+
+    def end_stream(self):
+        """Finish a track started with stream_to.
+
+        Write the remaining data and the end of track meta event and fill in
+        the length in the track header. Return the number of bytes written
+        for the track, header included.
+        """
+        fp = self._stream
+        if fp is None:
+            raise ValueError("end_stream called without stream_to")
+        self.flush_stream()
+        end = self.end_of_track()
+        fp.write(end)
+        chunk_size = self._stream_length + len(end)
+        fp.seek(self._stream_header_pos + len(TRACK_HEADER))
+        fp.write(chunk_size.to_bytes(4, "big"))
+        fp.seek(0, 2)
+        self._stream = None
+        return len(TRACK_HEADER) + 4 + chunk_size
 
     def midi_event(self, event_type, channel, param1, param2=None):
         """Convert and return the parameters as a MIDI event in bytes."""
@@ -167,19 +277,22 @@ class MidiTrack(object):
         assert param2 is None or 0 <= param2 <= 0x7F
 
         status_byte = channel | (event_type << 4)
-        params = [param1]
-        if param2 is not None:
-            params.append(param2)
+        if param2 is None:
+            return self.delta_time + bytes((status_byte, param1))
+        return self.delta_time + bytes((status_byte, param1, param2))
 
-        return self.delta_time + bytes([status_byte] + params)
+    # note_on and note_off run for every note, so they build their event
+    # directly instead of going through midi_event.
 
     def note_off(self, channel, note, velocity):
         """Return bytes for a 'note off' event."""
-        return self.midi_event(NOTE_OFF, channel, note, velocity)
+        assert 0 <= channel < 16 and 0 <= note <= 0x7F and 0 <= velocity <= 0x7F
+        return self.delta_time + bytes((_NOTE_OFF_STATUS | channel, note, velocity))
 
     def note_on(self, channel, note, velocity):
         """Return bytes for a 'note_on' event."""
-        return self.midi_event(NOTE_ON, channel, note, velocity)
+        assert 0 <= channel < 16 and 0 <= note <= 0x7F and 0 <= velocity <= 0x7F
+        return self.delta_time + bytes((_NOTE_ON_STATUS | channel, note, velocity))
 
     def controller_event(self, channel, contr_nr, contr_val):
         """Return the bytes for a MIDI controller event."""
@@ -187,7 +300,7 @@ class MidiTrack(object):
 
     def reset(self):
         """Reset track_data and delta_time."""
-        self.track_data = b""
+        self.track_data = bytearray()
         self.delta_time = b"\x00"
 
     def set_deltatime(self, delta_time):
@@ -214,9 +327,7 @@ class MidiTrack(object):
 
     def set_tempo_event(self, bpm):
         """Calculate the microseconds per quarter note."""
-        ms_per_min = 60000000
-        mpqn = a2b_hex("%06x" % (ms_per_min // bpm))
-        return self.delta_time + META_EVENT + SET_TEMPO + b"\x03" + mpqn
+        return self.delta_time + _tempo_event(bpm)
 
     def set_meter(self, meter=(4, 4)):
         """Add a time signature event for meter to track_data."""
@@ -224,9 +335,7 @@ class MidiTrack(object):
 
     def time_signature_event(self, meter=(4, 4)):
         """Return a time signature event for meter."""
-        numer = a2b_hex("%02x" % meter[0])
-        denom = a2b_hex("%02x" % int(log(meter[1], 2)))
-        return self.delta_time + META_EVENT + TIME_SIGNATURE + b"\x04" + numer + denom + b"\x18\x08"
+        return self.delta_time + _time_signature_event(meter[0], meter[1])
 
     def set_key(self, key="C"):
         """Add a key signature event to the track_data."""
@@ -236,16 +345,10 @@ class MidiTrack(object):
 
     def key_signature_event(self, key="C"):
         """Return the bytes for a key signature event."""
-        if str(key).islower():
-            val = minor_keys.index(key) - 7
-            mode = b"\x01"
-        else:
-            val = major_keys.index(key) - 7
-            mode = b"\x00"
-        if val < 0:
-            val = 256 + val
-        key = a2b_hex("%02x" % val)
-        return self.delta_time + META_EVENT + KEY_SIGNATURE + b"\x02" + key + mode
+        try:
+            return self.delta_time + _KEY_SIGNATURES[key]
+        except KeyError:
+            raise ValueError("%r is not a valid key" % (key,))
 
     def set_track_name(self, name):
         """Add a meta event for the track."""
@@ -254,7 +357,7 @@ class MidiTrack(object):
     def track_name_event(self, name):
         """Return the bytes for a track name meta event."""
         l = self.int_to_varbyte(len(name))
-        return b"\x00" + META_EVENT + TRACK_NAME + l + name.encode("ascii")
+        return b"".join((b"\x00", META_EVENT, TRACK_NAME, l, name.encode("ascii")))
 
     def int_to_varbyte(self, value):
         """Convert an integer into a variable length byte.
@@ -264,14 +367,32 @@ class MidiTrack(object):
         are more bytes following. The remaining 7 bits (mask 0x7F) are used
         to store the value.
         """
+        # Delta times almost always fit in one to four bytes (the MIDI
+        # maximum), so spell those out and leave the loop for the rest.
+        if 0 <= value < 0x80:
+            return _SINGLE_VARBYTES[value]
+        if 0 <= value < 0x4000:
+            return bytes((value >> 7 | 0x80, value & 0x7F))
+        if 0 <= value < 0x200000:
+            return bytes((value >> 14 | 0x80, value >> 7 & 0x7F | 0x80, value & 0x7F))
+        if 0 <= value < 0x10000000:
+            return bytes(
+                (
+                    value >> 21 | 0x80,
+                    value >> 14 & 0x7F | 0x80,
+                    value >> 7 & 0x7F | 0x80,
+                    value & 0x7F,
+                )
+            )
+
         # Warning: bit kung-fu ahead. The length of the integer in bytes
-        length = int(log(max(value, 1), 0x80)) + 1
+        length = (max(value, 1).bit_length() + 6) // 7
 
         # Remove the highest bit and move the bits to the right if length > 1
-        bytes = [value >> i * 7 & 0x7F for i in range(length)]
-        bytes.reverse()
+        varbytes = [value >> i * 7 & 0x7F for i in range(length)]
+        varbytes.reverse()
 
         # Set the first bit on every one but the last bit.
-        for i in range(len(bytes) - 1):
-            bytes[i] = bytes[i] | 0x80
-        return pack("%sB" % len(bytes), *bytes)
+        for i in range(len(varbytes) - 1):
+            varbytes[i] = varbytes[i] | 0x80
+        return pack("%sB" % len(varbytes), *varbytes)
@@ -1,7 +1,5 @@
 import logging
 
-import sortedcontainers
-
 from mingus.containers import PercussionNote
 import mingus.tools.mingus_json as mingus_json
 
@@ -41,9 +39,8 @@ class Sequencer:
     events as the values.
 
     To build the score, just go through all the tracks, bars, notes, etc... and add keys and events.
-    Then when playing the score, first sort by keys.
-
-    We use sortedcontainers containers to make that fast for the case where there are thousands of events.
+    Then when playing the score, first sort by keys. The score is complete by then, so a single
+    sort is all that is needed, even when there are thousands of events.
     """
     def __init__(self, score=None):
         super().__init__()
@@ -98,15 +95,22 @@ class Sequencer:
         :param end_time: in milliseconds
         :return: None
         """
-        score = sortedcontainers.SortedDict(self.score)
-
         for channel, instrument in self.instruments:
             synth.set_instrument(channel, instrument.number, instrument.bank)
             logging.info(f'Instrument: {instrument.number}  Channel: {channel}')
         logging.info('--------------\n')
 
+        # Formatting a message for every event is expensive, so only do it when it will be logged
+        log_events = logging.getLogger().isEnabledFor(logging.INFO)
+
+        # Look up the synth methods once, not for every event
+        play_note = synth.play_note
+        stop_note = synth.stop_note
+        play_percussion_note = synth.play_percussion_note
+        stop_percussion_note = synth.stop_percussion_note
+
         the_time = 0
-        for event_start_time, events in score.items():
+        for event_start_time, events in sorted(self.score.items()):
             if stop_func and stop_func():
                 break
 
@@ -119,38 +123,48 @@ class Sequencer:
                 synth.sleep(dt / 1000.0)
             the_time = event_start_time
 
+            # Notes before start_time are not started, but they are still stopped
+            start_notes = event_start_time >= start_time
             for event in events:
-                if event['func'] == 'start_note' and event_start_time >= start_time:
-                    if isinstance(event['note'], PercussionNote):
-                        synth.play_percussion_note(event['note'], event['channel'], event['velocity'])
+                func = event['func']
+                if func == 'start_note':
+                    if not start_notes:
+                        continue
+                    note = event['note']
+                    if isinstance(note, PercussionNote):
+                        play_percussion_note(note, event['channel'], event['velocity'])
                     else:
-                        synth.play_note(event['note'], event['channel'], event['velocity'])
+                        play_note(note, event['channel'], event['velocity'])
 
-                    logging.info('Start: {} Note: {note}  Velocity: {velocity}  Channel: {channel}'.
-                                 format(the_time, **event))
+                    if log_events:
+                        logging.info('Start: %s Note: %s  Velocity: %s  Channel: %s',
+                                     the_time, note, event['velocity'], event['channel'])
 
-                elif event['func'] == 'end_note':
-                    if isinstance(event['note'], PercussionNote):
-                        synth.stop_percussion_note(event['note'], event['channel'])
+                elif func == 'end_note':
+                    note = event['note']
+                    if isinstance(note, PercussionNote):
+                        stop_percussion_note(note, event['channel'])
                     else:
-                        synth.stop_note(event['note'], event['channel'])
-                    logging.info('Stop: {} Note: {note}  Channel: {channel}'.format(the_time, **event))
+                        stop_note(note, event['channel'])
+                    if log_events:
+                        logging.info('Stop: %s Note: %s  Channel: %s',
+                                     the_time, note, event['channel'])
 
-                elif event['func'] == 'control_change':
+                elif func == 'control_change':
                     synth.control_change(event['channel'], event['control'].value, event['value'])
-                    logging.info('Control change: Channel: {channel}  Control: {control}  Value: {value}'.
-                                 format(the_time, **event))
+                    if log_events:
+                        logging.info('Control change: Channel: %s  Control: %s  Value: %s',
+                                     event['channel'], event['control'], event['value'])
 
-            logging.info('--------------\n')
+            if log_events:
+                logging.info('--------------\n')
         synth.sleep(2)  # prevent cutoff at the end
 
     def save_tracks(self, path, tracks, channels, bpm):
         self.play_Tracks(tracks, channels, bpm=bpm)
-        score = sortedcontainers.SortedDict(self.score)
-
         to_save = {
             'instruments': self.instruments,
-            'score': dict(score)
+            'score': dict(sorted(self.score.items()))
         }
 
         with open(path, 'w') as fp:
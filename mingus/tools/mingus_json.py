@@ -72,6 +72,8 @@ def load(fp):
 
 
 class JsonMixin:
+    __slots__ = ()
+
     def to_json(self):
         d = {'class_name': self.__class__.__name__}
         return d
@@ -28,12 +28,23 @@ class test_Note(unittest.TestCase):
         self.assertTrue(self.b4 < self.b5)
         self.assertTrue(Note("C") > Note("Cb"))
         self.assertTrue(self.c > None)
+        self.assertTrue(self.c >= None)
+        self.assertFalse(self.c <= None)
+        self.assertTrue(Note("C", 4) <= 48)
+        self.assertTrue(Note("C", 4) > 47)
 
     def test_eq(self):
         self.assertTrue(self.c != self.c1)
         self.assertTrue(self.c == self.c)
         self.assertTrue(Note("C") == Note("C"))
         self.assertTrue(self.c != None)
+        self.assertTrue(Note("C#") == Note("Db"))
+        self.assertFalse(Note("C", 4) == Note("C", 5))
+
+    def test_hash(self):
+        self.assertEqual(hash(Note("C#")), hash(Note("Db")))
+        self.assertEqual(1, len({Note("C#"), Note("Db"), Note("C#")}))
+        self.assertIn(48, {Note("C", 4)})
 
     def test_to_int(self):
         self.assertEqual(48, Note("C", 4))
@@ -41,6 +52,18 @@ class test_Note(unittest.TestCase):
         self.assertEqual(36, int(self.c2))
         self.assertEqual(71, int(self.b5))
         self.assertEqual(59, int(self.b4))
+        self.assertEqual(61, int(Note("B##", 4)))
+        self.assertEqual(44, int(Note("Cbbbb", 4)))
+
+    def test_to_int_after_change(self):
+        n = Note("C", 4)
+        self.assertEqual(48, int(n))
+        n.name = "D"
+        self.assertEqual(50, int(n))
+        n.octave = 5
+        self.assertEqual(62, int(n))
+        n.augment()
+        self.assertEqual(63, int(n))
 
     def test_set_note(self):
         n = Note()
@@ -61,6 +84,9 @@ class test_Note(unittest.TestCase):
         self.assertEqual(Note("A", 4).to_hertz(), 440)
         self.assertEqual(Note("A", 5).to_hertz(), 880)
         self.assertEqual(Note("A", 6).to_hertz(), 1760)
+        self.assertEqual(Note("A", 12).to_hertz(), 112640)
+        self.assertAlmostEqual(Note("A", 4).to_hertz(432), 432)
+        self.assertAlmostEqual(Note("A", 5).to_hertz(432), 864)
 
     def test_from_hertz(self):
         a = Note()
@@ -93,6 +119,14 @@ class test_Note(unittest.TestCase):
         a.transpose("5", False)
         self.assertEqual(Note("C-5"), a)
 
+    def test_repr(self):
+        n = Note("C", 4)
+        self.assertEqual("'C-4'", repr(n))
+        n.transpose("3")
+        self.assertEqual("'E-4'", repr(n))
+        n.octave_up()
+        self.assertEqual("'E-5'", repr(n))
+
     def test_from_int(self):
         self.assertEqual(Note("C", 0), Note().from_int(0))
         self.assertEqual(Note("C", 1), Note().from_int(12))
@@ -138,6 +172,10 @@ class test_Note(unittest.TestCase):
             Note("A", 4, {"velocity": 200})
         with self.assertRaises(ValueError):
             Note("A", 4, {"velocity": -1})
+        with self.assertRaises(ValueError):
+            Note("A", 4, velocity=200)
+        with self.assertRaises(TypeError):
+            Note("A", 4, velocity=None)
 
 
 def load_tests(loader, tests, ignore):
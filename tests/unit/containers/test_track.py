@@ -1,11 +1,13 @@
 from __future__ import absolute_import
 
 import doctest
+import importlib.util
 import unittest
 
 import mingus.containers.track
+from mingus.containers.bar import Bar
 from mingus.containers.instrument import Instrument, Piano, Guitar
-from mingus.containers.track import Track
+from mingus.containers.track import Track, ControlChangeEvent
 
 
 class test_Track(unittest.TestCase):
@@ -46,6 +48,25 @@ class test_Track(unittest.TestCase):
         self.assertEqual(s, t)
 
 
+class test_Track_repeat(unittest.TestCase):
+    def test_repeat_keeps_callers_bars(self):
+        bars = [Bar(), Bar()]
+        t = Track(Piano("Piano"), bars=bars)
+        t.repeat(2)
+        self.assertEqual(6, len(t.bars))
+        self.assertEqual(2, len(bars))
+
+
+class test_ControlChangeEvent(unittest.TestCase):
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "schedule_many requires numpy")
+    def test_schedule_many(self):
+        beats = [0, 0.5, 1, 3.3, 7.25, 100]
+        score = {}
+        for beat in beats:
+            ControlChangeEvent(beat, 7, 100).put_into_score(score, 1, 130.0)
+        self.assertEqual(sorted(score), list(ControlChangeEvent.schedule_many(beats, 130.0)))
+
+
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(mingus.containers.note))
     return tests
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+import io
+import unittest
+
+from mingus.containers.bar import Bar
+from mingus.midi.midi_file_out import MidiFile
+from mingus.midi.midi_track import MidiTrack
+
+
+class test_MidiTrack(unittest.TestCase):
+    def setUp(self):
+        self.bars = []
+        for notes in (["C", "E", "G"], ["D", "F"], ["B"]):
+            b = Bar()
+            b + notes
+            b + None
+            for n in b[0][2]:
+                n.channel = 1
+            self.bars.append(b)
+
+    def test_stream_to(self):
+        m = MidiTrack(140)
+        for b in self.bars:
+            m.play_Bar(b)
+        expected = m.get_midi_data()
+
+        fp = io.BytesIO()
+        fp.write(b"head")
+        m = MidiTrack(140)
+        m.stream_to(fp)
+        for b in self.bars:
+            m.play_Bar(b)
+        written = m.end_stream()
+        self.assertEqual(len(expected), written)
+        self.assertEqual(b"head" + expected, fp.getvalue())
+        self.assertEqual(b"", bytes(m.track_data))
+
+    def test_stream_errors(self):
+        m = MidiTrack()
+        self.assertRaises(ValueError, m.end_stream)
+        m.stream_to(io.BytesIO())
+        self.assertRaises(ValueError, m.header)
+        self.assertRaises(ValueError, m.get_midi_data)
+        m.end_stream()
+        self.assertRaises(ValueError, m.end_stream)
+        self.assertRaises(ValueError, m.header)
+        self.assertRaises(ValueError, m.get_midi_data)
+
+    def test_midi_file_skips_empty_track(self):
+        full = MidiTrack()
+        empty = MidiTrack()
+        empty.reset()
+        f = MidiFile([full, empty])
+        self.assertEqual(b"\x00\x01", f.header()[10:12])
+        self.assertEqual(f.header() + full.get_midi_data(), f.get_midi_data())
+
+    def test_flush_stream_without_stream(self):
+        m = MidiTrack()
+        data = bytes(m.track_data)
+        m.flush_stream()
+        self.assertEqual(data, bytes(m.track_data))
+
+    def test_int_to_varbyte(self):
+        m = MidiTrack()
+        self.assertEqual(b"\x00", m.int_to_varbyte(0))
+        self.assertEqual(b"\x01", m.int_to_varbyte(1))
+        self.assertEqual(b"\x7f", m.int_to_varbyte(0x7F))
+        self.assertEqual(b"\x81\x00", m.int_to_varbyte(0x80))
+        self.assertEqual(b"\xff\x7f", m.int_to_varbyte(0x3FFF))
+        self.assertEqual(b"\x81\x80\x00", m.int_to_varbyte(0x4000))
+        self.assertEqual(b"\xff\xff\x7f", m.int_to_varbyte(0x1FFFFF))
+        self.assertEqual(b"\x81\x80\x80\x00", m.int_to_varbyte(0x200000))
+        self.assertEqual(b"\xff\xff\xff\x7f", m.int_to_varbyte(0x0FFFFFFF))
+        self.assertEqual(b"\x81\x80\x80\x80\x00", m.int_to_varbyte(0x10000000))
+        self.assertEqual(b"\x7f", m.int_to_varbyte(-1))
+
+    def test_key_signature_event(self):
+        m = MidiTrack()
+        self.assertEqual(b"\x00\xff\x59\x02\xf9\x00", m.key_signature_event("Cb"))
+        self.assertEqual(b"\x00\xff\x59\x02\x00\x00", m.key_signature_event("C"))
+        self.assertEqual(b"\x00\xff\x59\x02\x07\x00", m.key_signature_event("C#"))
+        self.assertEqual(b"\x00\xff\x59\x02\x00\x01", m.key_signature_event("a"))
+        self.assertEqual(b"\x00\xff\x59\x02\xf9\x01", m.key_signature_event("ab"))
+        self.assertEqual(b"\x00\xff\x59\x02\xfe\x01", m.key_signature_event("g"))
+        self.assertRaises(ValueError, m.key_signature_event, "H")
@@ -1,5 +1,6 @@
 from mingus.midi.sequencer2 import Sequencer
-from mingus.containers import PercussionNote, Track
+from mingus.containers import Note, PercussionNote, Track
+from mingus.containers.track import MidiControl
 from mingus.containers.raw_snippet import RawSnippet
 
 import midi_percussion as mp
@@ -30,3 +31,68 @@ def test_snippets():
     assert sequencer.score[0][0]['channel'] == channel
     assert sequencer.score[0][0]['velocity'] == 64
     assert isinstance(sequencer.score[0][0]['note'], PercussionNote)
+
+
+class RecordingSynth:
+    def __init__(self):
+        self.calls = []
+
+    def set_instrument(self, channel, number, bank):
+        self.calls.append(('set_instrument', channel, number, bank))
+
+    def sleep(self, seconds):
+        pass
+
+    def play_note(self, note, channel, velocity):
+        self.calls.append(('play_note', note, channel, velocity))
+
+    def stop_note(self, note, channel):
+        self.calls.append(('stop_note', note, channel))
+
+    def play_percussion_note(self, note, channel, velocity):
+        self.calls.append(('play_percussion_note', note, channel, velocity))
+
+    def stop_percussion_note(self, note, channel):
+        self.calls.append(('stop_percussion_note', note, channel))
+
+    def control_change(self, channel, control, value):
+        self.calls.append(('control_change', channel, control, value))
+
+
+def test_play_score():
+    c = Note('C', 4)
+    e = Note('E', 4)
+    snare = PercussionNote(
+        name=None, number=mp.percussion_instruments['Acoustic Snare'], velocity=64, channel=9
+    )
+    score = {
+        50: [
+            {'func': 'end_note', 'note': e, 'channel': 1},
+            {'func': 'end_note', 'note': snare, 'channel': 9},
+        ],
+        0: [
+            {'func': 'start_note', 'note': c, 'channel': 1, 'velocity': 80},
+            {'func': 'control_change', 'control': MidiControl.VOLUME, 'value': 100, 'channel': 1},
+        ],
+        30: [
+            {'func': 'end_note', 'note': c, 'channel': 1},
+            {'func': 'start_note', 'note': snare, 'channel': 9, 'velocity': 64},
+        ],
+        40: [
+            {'func': 'start_note', 'note': e, 'channel': 1, 'velocity': 90},
+            {'func': 'start_note', 'note': snare, 'channel': 9, 'velocity': 64},
+        ],
+    }
+    synth = RecordingSynth()
+    Sequencer(score=score).play_score(synth, start_time=35)
+
+    # Notes before start_time are not started, but they are still stopped.
+    # Control changes always fire.
+    assert synth.calls == [
+        ('control_change', 1, MidiControl.VOLUME.value, 100),
+        ('stop_note', c, 1),
+        ('play_note', e, 1, 90),
+        ('play_percussion_note', snare, 9, 64),
+        ('stop_note', e, 1),
+        ('stop_percussion_note', snare, 9),
+    ]